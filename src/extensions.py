@@ -1,16 +1,130 @@
 """Application extensions.
 
 This module centralizes the initialization of extensions used across the
-application. It currently exposes a SQLAlchemy database instance that can be
-imported by any module that needs to interact with the persistence layer.
+application. It exposes a SQLAlchemy database instance that can be imported by
+any module that needs to interact with the persistence layer, and a Redis
+backed cache used to short-circuit hot read paths.
 """
 from __future__ import annotations
 
+import time
+from typing import List, Optional
+
+from flask import Flask, current_app
 from flask_sqlalchemy import SQLAlchemy
+from redis import Redis
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    RedisError,
+    TimeoutError as RedisTimeoutError,
+)
 
 # Global SQLAlchemy database instance. Modules should import this rather than
 # instantiating their own `SQLAlchemy` object so that configuration performed in
 # ``create_app`` is consistently applied everywhere.
 db: SQLAlchemy = SQLAlchemy()
 
-__all__ = ["db"]
+
+class RedisCache:
+    """Best-effort Redis cache bound to the Flask application.
+
+    The cache is optional: when ``REDIS_URL`` is not configured, or when Redis
+    cannot be reached, every operation degrades to a no-op so callers always
+    fall back to the database. After a connection failure the cache stays
+    disabled for ``REDIS_RETRY_AFTER`` seconds instead of paying the socket
+    timeout again on every call.
+    """
+
+    extension_name = "redis"
+    _retry_at_key = "redis.retry_at"
+
+    def init_app(self, app: Flask) -> None:
+        url = app.config.get("REDIS_URL")
+        client = None
+        if url:
+            client = Redis.from_url(
+                url,
+                socket_timeout=app.config.get("REDIS_SOCKET_TIMEOUT", 0.5),
+                socket_connect_timeout=app.config.get("REDIS_SOCKET_TIMEOUT", 0.5),
+            )
+        app.extensions[self.extension_name] = client
+        app.extensions[self._retry_at_key] = 0.0
+
+    @property
+    def client(self) -> Optional[Redis]:
+        """Return the Redis client, or ``None`` while it is unavailable."""
+        extensions = current_app.extensions
+        if time.monotonic() < extensions.get(self._retry_at_key, 0.0):
+            return None
+        return extensions.get(self.extension_name)
+
+    def _failed(self, command: str, key: object, exc: RedisError) -> None:
+        current_app.logger.warning("Redis %s %s failed: %s", command, key, exc)
+        if isinstance(exc, (RedisConnectionError, RedisTimeoutError)):
+            retry_after = current_app.config.get("REDIS_RETRY_AFTER", 30.0)
+            current_app.extensions[self._retry_at_key] = time.monotonic() + retry_after
+
+    def get(self, key: str) -> Optional[bytes]:
+        client = self.client
+        if client is None:
+            return None
+        try:
+            return client.get(key)
+        except RedisError as exc:
+            self._failed("GET", key, exc)
+            return None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        client = self.client
+        if client is None or ttl <= 0:
+            return
+        try:
+            client.setex(key, ttl, value)
+        except RedisError as exc:
+            self._failed("SETEX", key, exc)
+
+    def delete(self, *keys: str) -> None:
+        client = self.client
+        if client is None or not keys:
+            return
+        try:
+            client.delete(*keys)
+        except RedisError as exc:
+            self._failed("DEL", keys, exc)
+
+    def push(self, key: str, *values: str, front: bool = False) -> bool:
+        """Append ``values`` to the list at ``key``; return ``True`` on success.
+
+        With ``front=True`` the values are prepended instead, so they are the
+        next ones returned by :meth:`pop_many`.
+        """
+        client = self.client
+        if client is None or not values:
+            return False
+        command = "LPUSH" if front else "RPUSH"
+        try:
+            if front:
+                client.lpush(key, *values)
+            else:
+                client.rpush(key, *values)
+        except RedisError as exc:
+            self._failed(command, key, exc)
+            return False
+        return True
+
+    def pop_many(self, key: str, count: int) -> List[bytes]:
+        """Atomically remove and return up to ``count`` items from ``key``."""
+        client = self.client
+        if client is None:
+            return []
+        try:
+            return client.lpop(key, count) or []
+        except RedisError as exc:
+            self._failed("LPOP", key, exc)
+            return []
+
+
+# Global cache instance, configured from ``REDIS_URL`` in ``create_app``.
+cache: RedisCache = RedisCache()
+
+__all__ = ["cache", "db", "RedisCache"]
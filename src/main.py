@@ -1,17 +1,27 @@
 """umbra-security-service - Service de sécurité, anti-triche et protection."""
 
 import os
+import time
+from datetime import datetime, timezone
 from typing import Optional
 
-from dotenv import load_dotenv
-from flask import Flask, jsonify
+import click
+from flask import Flask, g, jsonify
 from flask_cors import CORS
+from flask_orjson import OrjsonProvider
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.pool import StaticPool
 
-from src.extensions import db
+from src.extensions import cache, db
 from src.routes import anomalies_bp, auth_bp
+from src.services.auth import flush_last_logins
 
-load_dotenv()
+if os.getenv("SKIP_DOTENV") != "1":
+    # Containers usually inject their environment directly; SKIP_DOTENV=1
+    # avoids importing python-dotenv and probing for a .env file at startup.
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 
 def _str_to_bool(value: Optional[str], default: bool = False) -> bool:
@@ -22,9 +32,19 @@ def _str_to_bool(value: Optional[str], default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+def _env_int(name: str, default: int) -> int:
+    """Read an integer from the environment, falling back to ``default``."""
+
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return int(value)
+
+
 def create_app() -> Flask:
     app = Flask(__name__)
     CORS(app)
+    app.json = OrjsonProvider(app)
 
     # Configuration
     app.config["DEBUG"] = _str_to_bool(os.getenv("FLASK_DEBUG"))
@@ -32,6 +52,17 @@ def create_app() -> Flask:
     database_url = os.getenv("DATABASE_URL")
     if database_url:
         app.config["SQLALCHEMY_DATABASE_URI"] = database_url
+        if not database_url.startswith("sqlite"):
+            app.config.setdefault(
+                "SQLALCHEMY_ENGINE_OPTIONS",
+                {
+                    "pool_pre_ping": True,
+                    "pool_size": _env_int("DB_POOL_SIZE", 10),
+                    "max_overflow": _env_int("DB_MAX_OVERFLOW", 20),
+                    "pool_timeout": _env_int("DB_POOL_TIMEOUT", 30),
+                    "pool_recycle": _env_int("DB_POOL_RECYCLE", 1800),
+                },
+            )
     else:
         # Fall back to an in-memory SQLite database for local development and testing.
         app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite+pysqlite:///:memory:"
@@ -46,7 +77,21 @@ def create_app() -> Flask:
     app.config.setdefault("SQLALCHEMY_TRACK_MODIFICATIONS", False)
     app.config["SQLALCHEMY_ECHO"] = _str_to_bool(os.getenv("SQLALCHEMY_ECHO"))
 
+    app.config["REDIS_URL"] = os.getenv("REDIS_URL")
+    # Accept session tokens hashed with SHA-256 before the BLAKE2b switch.
+    # Every such session has expired 30 days after that deploy: remove the
+    # flag and its fallback in ``validate_token`` after 2026-11-15.
+    app.config["ACCEPT_LEGACY_TOKEN_DIGESTS"] = _str_to_bool(
+        os.getenv("ACCEPT_LEGACY_TOKEN_DIGESTS"), default=True
+    )
+
     db.init_app(app)
+    cache.init_app(app)
+
+    @app.before_request
+    def _capture_request_time():
+        # Read by ``utcnow`` so a request stamps one consistent timestamp.
+        g.now_utc = datetime.now(timezone.utc)
 
     # Health check endpoint
     @app.route("/health")
@@ -62,6 +107,31 @@ def create_app() -> Flask:
             200,
         )
 
+    @app.cli.command("flush-last-logins")
+    @click.option(
+        "--interval",
+        type=float,
+        default=0.0,
+        help="Repeat every INTERVAL seconds instead of flushing once.",
+    )
+    def flush_last_logins_command(interval: float) -> None:
+        """Write login timestamps queued in Redis to the database."""
+        while True:
+            flushed = 0
+            try:
+                # Drain the whole backlog, one batch at a time.
+                while batch := flush_last_logins():
+                    flushed += batch
+            except SQLAlchemyError as exc:
+                if interval <= 0:
+                    raise
+                # Stamps were re-queued: retry on the next tick.
+                app.logger.warning("Flushing last_login_at failed: %s", exc)
+            click.echo(f"{flushed} last_login_at value(s) flushed.")
+            if interval <= 0:
+                return
+            time.sleep(interval)
+
     # Register service blueprints
     app.register_blueprint(auth_bp)
     app.register_blueprint(anomalies_bp)
@@ -3,22 +3,51 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from flask import g, has_request_context
 
 from src.extensions import db
 
+UTC = timezone.utc
+
+
+def as_utc(moment: Optional[datetime]) -> Optional[datetime]:
+    """Return ``moment`` as an aware UTC datetime, treating naive values as UTC."""
+    if moment is None:
+        return None
+    tzinfo = moment.tzinfo
+    if tzinfo is UTC:
+        return moment
+    if tzinfo is None:
+        return moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC)
+
+
+def generate_id() -> str:
+    """Return a new primary key value."""
+    return str(uuid.uuid4())
+
+
+def utcnow() -> datetime:
+    """Return the current UTC datetime.
 
-def _utcnow() -> datetime:
-    """Return the current UTC datetime."""
-    return datetime.now(timezone.utc)
+    Inside a request, the timestamp captured when the request started is
+    reused so every timestamp written by that request is identical.
+    """
+    if has_request_context():
+        now = g.get("now_utc")
+        if now is not None:
+            return now
+    return datetime.now(UTC)
 
 
 class TimestampMixin:
     """Mixin that adds timestamp columns to a model."""
 
-    created_at = db.Column(db.DateTime(timezone=True), default=_utcnow, nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), default=utcnow, nullable=False)
     updated_at = db.Column(
-        db.DateTime(timezone=True), default=_utcnow, onupdate=_utcnow, nullable=False
+        db.DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False
     )
 
 
@@ -27,12 +56,13 @@ class BaseModel(db.Model, TimestampMixin):
 
     __abstract__ = True
 
+    # Stored as a native 16-byte UUID on PostgreSQL (CHAR(32) elsewhere) while
+    # still exposed to Python as the canonical string form.
     id = db.Column(
-        db.String(36),
+        db.Uuid(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=generate_id,
         nullable=False,
-        unique=True,
     )
 
     def as_dict(self) -> Dict[str, Any]:
@@ -45,4 +75,4 @@ class BaseModel(db.Model, TimestampMixin):
         return f"<{self.__class__.__name__} id={self.id}>"
 
 
-__all__ = ["BaseModel", "TimestampMixin"]
+__all__ = ["UTC", "BaseModel", "TimestampMixin", "as_utc", "generate_id", "utcnow"]
@@ -1,13 +1,13 @@
 """Session token model definition."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from src.models.base import BaseModel
+from src.models.base import UTC, BaseModel, as_utc, utcnow
 
 
 class SessionToken(BaseModel):
@@ -29,6 +29,10 @@ class SessionToken(BaseModel):
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
+    # Mirror of ``expires_at`` as Unix seconds, kept in sync on assignment, so
+    # hot-path expiry checks compare integers in SQL and in Python. Lookups go
+    # through the partial ``(hash, expires_at_epoch)`` indexes below.
+    expires_at_epoch: Mapped[int] = mapped_column(BigInteger, nullable=False)
     revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     last_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     ip_address: Mapped[Optional[str]] = mapped_column(String(45))
@@ -37,35 +41,54 @@ class SessionToken(BaseModel):
 
     user: Mapped["User"] = relationship("User", back_populates="sessions")
 
-    __table_args__ = (Index("ix_session_tokens_user_active", "user_id", "expires_at"),)
+    __table_args__ = (
+        Index("ix_session_tokens_user_active", "user_id", "expires_at"),
+        # Partial indexes covering only non-revoked sessions, used by token
+        # validation which filters revoked rows in SQL.
+        Index(
+            "ix_session_tokens_active_access",
+            "access_token_hash",
+            "expires_at_epoch",
+            postgresql_where=text("revoked_at IS NULL"),
+            sqlite_where=text("revoked_at IS NULL"),
+        ),
+        Index(
+            "ix_session_tokens_active_refresh",
+            "refresh_token_hash",
+            "expires_at_epoch",
+            postgresql_where=text("revoked_at IS NULL"),
+            sqlite_where=text("revoked_at IS NULL"),
+        ),
+    )
 
-    @staticmethod
-    def _ensure_aware(moment: datetime | None) -> datetime | None:
-        if moment is None:
-            return None
-        if moment.tzinfo is None:
-            return moment.replace(tzinfo=timezone.utc)
-        return moment.astimezone(timezone.utc)
+    @validates("expires_at")
+    def _sync_expires_at_epoch(self, key: str, value: datetime) -> datetime:
+        self.expires_at_epoch = (
+            int(as_utc(value).timestamp()) if value is not None else None
+        )
+        return value
 
     @property
     def is_active(self) -> bool:
         """Return ``True`` when the session is not expired nor revoked."""
         if self.revoked_at is not None:
             return False
-        expires_at = self._ensure_aware(self.expires_at)
+        expires_at = self.expires_at
         if expires_at is None:
             return False
-        return expires_at >= datetime.now(timezone.utc)
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=UTC)
+        return expires_at >= utcnow()
 
     def revoke(self, when: Optional[datetime] = None) -> None:
         """Mark the session as revoked."""
-        moment = when or datetime.now(timezone.utc)
-        self.revoked_at = self._ensure_aware(moment)
+        moment = when or utcnow()
+        self.revoked_at = as_utc(moment)
 
     def touch(self, when: Optional[datetime] = None) -> None:
         """Update the ``last_seen_at`` timestamp."""
-        moment = when or datetime.now(timezone.utc)
-        self.last_seen_at = self._ensure_aware(moment)
+        moment = when or utcnow()
+        self.last_seen_at = as_utc(moment)
 
     def __repr__(self) -> str:
         return f"<SessionToken user_id={self.user_id!r}>"
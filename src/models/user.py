@@ -21,7 +21,10 @@ class User(BaseModel):
     username: Mapped[Optional[str]] = mapped_column(
         String(80), nullable=True, unique=True, index=True
     )
-    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Only credential checks need the hash; load it explicitly with ``undefer``.
+    password_hash: Mapped[str] = mapped_column(
+        String(255), nullable=False, deferred=True
+    )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
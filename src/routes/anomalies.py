@@ -1,18 +1,24 @@
 """Anomaly detection routes."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any, Dict
 
-from flask import Blueprint, jsonify, request
+import orjson
+from flask import Blueprint, Response, request
 
+from src.models.base import utcnow
 from src.services.anomaly import anomaly_detector
 
 anomalies_bp = Blueprint("anomalies", __name__, url_prefix="/anomalies")
 
 
-def _json_response(payload: Dict[str, Any], status_code: int):
-    return jsonify(payload), status_code
+def _json_response(payload: Dict[str, Any], status_code: int) -> Response:
+    # Encode straight to bytes; ``jsonify`` would round-trip through ``str``.
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC),
+        status=status_code,
+        mimetype="application/json",
+    )
 
 
 @anomalies_bp.post("/detect")
@@ -49,7 +55,7 @@ def detect_anomalies():
             "message": "Analyse réalisée.",
             "data": {
                 "player_id": player_id,
-                "evaluated_at": datetime.now(timezone.utc).isoformat(),
+                "evaluated_at": utcnow(),
                 "is_suspicious": result.is_suspicious,
                 "risk_score": result.risk_score,
                 "reasons": result.reasons,
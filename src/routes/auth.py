@@ -1,18 +1,21 @@
 """Authentication and user session routes."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any, Dict
 
-from flask import Blueprint, jsonify, request
+import orjson
+from flask import Blueprint, Response, request
 
 from src.extensions import db
+from src.models.base import as_utc
 from src.services.auth import (
     InactiveUserError,
     InvalidCredentialsError,
     UserAlreadyExistsError,
     create_user,
+    record_login,
     serialize_user,
+    serialize_user_cached,
     start_session,
     validate_token,
     verify_credentials,
@@ -21,8 +24,13 @@ from src.services.auth import (
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
 
-def _json_response(payload: Dict[str, Any], status_code: int):
-    return jsonify(payload), status_code
+def _json_response(payload: Dict[str, Any], status_code: int) -> Response:
+    # Encode straight to bytes; ``jsonify`` would round-trip through ``str``.
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC),
+        status=status_code,
+        mimetype="application/json",
+    )
 
 
 @auth_bp.post("/register")
@@ -69,21 +77,19 @@ def register():
         user_agent=request.headers.get("User-Agent"),
         persistent=remember_me,
     )
-    user.last_login_at = datetime.now(timezone.utc)
-
+    record_login(user)
+    # Serialise before committing, which would expire and reload the user.
+    payload = {
+        "success": True,
+        "message": "Inscription réussie.",
+        "data": {
+            "user": serialize_user(user),
+            "tokens": tokens,
+        },
+    }
     db.session.commit()
 
-    return _json_response(
-        {
-            "success": True,
-            "message": "Inscription réussie.",
-            "data": {
-                "user": serialize_user(user),
-                "tokens": tokens,
-            },
-        },
-        201,
-    )
+    return _json_response(payload, 201)
 
 
 @auth_bp.post("/login")
@@ -129,20 +135,19 @@ def login():
         user_agent=request.headers.get("User-Agent"),
         persistent=remember_me,
     )
-    user.last_login_at = datetime.now(timezone.utc)
+    record_login(user)
+    # Serialise before committing, which would expire and reload the user.
+    payload = {
+        "success": True,
+        "message": "Connexion réussie.",
+        "data": {
+            "user": serialize_user(user),
+            "tokens": tokens,
+        },
+    }
     db.session.commit()
 
-    return _json_response(
-        {
-            "success": True,
-            "message": "Connexion réussie.",
-            "data": {
-                "user": serialize_user(user),
-                "tokens": tokens,
-            },
-        },
-        200,
-    )
+    return _json_response(payload, 200)
 
 
 @auth_bp.post("/validate")
@@ -186,24 +191,22 @@ def validate():
         )
 
     session_token.touch()
-    db.session.commit()
-
-    return _json_response(
-        {
-            "success": True,
-            "message": "Token valide.",
-            "data": {
-                "is_valid": True,
-                "user": serialize_user(session_token.user),
-                "session": {
-                    "id": session_token.id,
-                    "expires_at": session_token.expires_at.isoformat(),
-                    "last_seen_at": session_token.last_seen_at.isoformat()
-                    if session_token.last_seen_at
-                    else None,
-                    "is_persistent": session_token.is_persistent,
-                },
+    # Build the payload before committing: the commit expires loaded instances
+    # and reading them afterwards would reload both the session and the user.
+    payload = {
+        "success": True,
+        "message": "Token valide.",
+        "data": {
+            "is_valid": True,
+            "user": serialize_user_cached(session_token.user),
+            "session": {
+                "id": session_token.id,
+                "expires_at": as_utc(session_token.expires_at),
+                "last_seen_at": as_utc(session_token.last_seen_at),
+                "is_persistent": session_token.is_persistent,
             },
         },
-        200,
-    )
+    }
+    db.session.commit()
+
+    return _json_response(payload, 200)
@@ -2,7 +2,37 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+
+# Message and risk weight of each heuristic evaluated by ``AnomalyDetector``.
+_RULES: Tuple[Tuple[str, float], ...] = (
+    ("Activité par minute anormalement élevée.", 0.3),
+    ("Ratio éliminations/morts exceptionnellement élevé.", 0.25),
+    ("Précision et ratio de tirs critiques irréalistes.", 0.2),
+    ("Temps de réaction anormalement bas.", 0.1),
+    ("Multiples signalements suspects reçus.", 0.15),
+    ("Variations de vitesse incohérentes avec les règles du jeu.", 0.15),
+)
+
+
+def _outcome(mask: int) -> Tuple[Tuple[str, ...], float]:
+    """Return the reasons and capped risk score for a rule trigger mask."""
+
+    reasons: List[str] = []
+    score = 0.0
+    for index, (message, weight) in enumerate(_RULES):
+        if mask >> index & 1:
+            reasons.append(message)
+            score += weight
+    return tuple(reasons), min(score, 1.0)
+
+
+# With six rules there are only 64 possible outcomes: precompute them all so
+# ``evaluate`` reduces to comparisons and a single table lookup.
+_OUTCOMES: Tuple[Tuple[Tuple[str, ...], float], ...] = tuple(
+    _outcome(mask) for mask in range(1 << len(_RULES))
+)
 
 
 @dataclass(frozen=True)
@@ -31,62 +61,35 @@ class AnomalyDetector:
     def evaluate(self, metrics: Dict[str, float]) -> DetectionResult:
         """Evaluate metrics and decide whether behaviour is suspicious."""
 
-        reasons: List[str] = []
-        score = 0.0
-
-        def _register(condition: bool, message: str, weight: float) -> None:
-            nonlocal score
-            if condition:
-                reasons.append(message)
-                score += weight
-
-        apm = float(metrics.get("actions_per_minute", 0))
-        _register(
-            apm >= self.thresholds["actions_per_minute"],
-            "Activité par minute anormalement élevée.",
-            0.3,
+        get = metrics.get
+        apm = float(get("actions_per_minute", 0))
+        kdr = float(get("kill_death_ratio", 0))
+        headshot_ratio = float(get("headshot_ratio", 0))
+        accuracy = float(get("accuracy", 0))
+        reaction_time = float(get("reaction_time_ms", 9999))
+        reports = float(get("suspicious_reports", 0))
+        speed_multiplier = float(get("speed_multiplier", 1.0))
+
+        thresholds = self.thresholds
+        # Bit ``i`` is set when the i-th entry of ``_RULES`` is triggered.
+        mask = (
+            (apm >= thresholds["actions_per_minute"])
+            | (kdr >= thresholds["kill_death_ratio"]) << 1
+            | (
+                headshot_ratio >= thresholds["headshot_ratio"]
+                and accuracy >= thresholds["accuracy"]
+            )
+            << 2
+            | (reaction_time <= thresholds["reaction_time_ms"]) << 3
+            | (reports >= thresholds["suspicious_reports"]) << 4
+            | (speed_multiplier >= thresholds["speed_multiplier"]) << 5
         )
 
-        kdr = float(metrics.get("kill_death_ratio", 0))
-        _register(
-            kdr >= self.thresholds["kill_death_ratio"],
-            "Ratio éliminations/morts exceptionnellement élevé.",
-            0.25,
+        reasons, score = _OUTCOMES[mask]
+        return DetectionResult(
+            is_suspicious=bool(reasons), reasons=list(reasons), risk_score=score
         )
 
-        headshot_ratio = float(metrics.get("headshot_ratio", 0))
-        accuracy = float(metrics.get("accuracy", 0))
-        _register(
-            headshot_ratio >= self.thresholds["headshot_ratio"]
-            and accuracy >= self.thresholds["accuracy"],
-            "Précision et ratio de tirs critiques irréalistes.",
-            0.2,
-        )
-
-        reaction_time = float(metrics.get("reaction_time_ms", 9999))
-        _register(
-            reaction_time <= self.thresholds["reaction_time_ms"],
-            "Temps de réaction anormalement bas.",
-            0.1,
-        )
-
-        reports = float(metrics.get("suspicious_reports", 0))
-        _register(
-            reports >= self.thresholds["suspicious_reports"],
-            "Multiples signalements suspects reçus.",
-            0.15,
-        )
-
-        speed_multiplier = float(metrics.get("speed_multiplier", 1.0))
-        _register(
-            speed_multiplier >= self.thresholds["speed_multiplier"],
-            "Variations de vitesse incohérentes avec les règles du jeu.",
-            0.15,
-        )
-
-        score = min(score, 1.0)
-        return DetectionResult(is_suspicious=bool(reasons), reasons=reasons, risk_score=score)
-
 
 anomaly_detector = AnomalyDetector()
 
@@ -2,22 +2,51 @@
 from __future__ import annotations
 
 import hashlib
+import math
+import os
 import re
-import secrets
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
-
-from sqlalchemy.exc import IntegrityError
-from werkzeug.security import check_password_hash, generate_password_hash
-
-from src.extensions import db
+from base64 import urlsafe_b64encode
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from flask import current_app
+from sqlalchemy import case, event, or_, select, update
+from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
+from werkzeug.security import check_password_hash
+
+from src.extensions import cache, db
+from src.models.base import UTC, as_utc, utcnow
 from src.models.session import SessionToken
 from src.models.user import User
 
 _ACCESS_TOKEN_TTL = timedelta(hours=1)
 _PERSISTENT_TOKEN_TTL = timedelta(days=30)
+# Entropy, in bytes, of each issued token.
+_ACCESS_TOKEN_BYTES = 32
+_REFRESH_TOKEN_BYTES = 40
+_PERSISTENT_REFRESH_TOKEN_BYTES = 48
 _EMAIL_REGEX = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+# RFC 5321 path limit; also bounds the regex backtracking on hostile input.
+_EMAIL_MAX_LENGTH = 254
+_USER_CACHE_PREFIX = "user:ser"
+_USER_CACHE_TTL = 300
+# Redis list buffering ``user_id|epoch`` login stamps until they are flushed.
+_LAST_LOGIN_QUEUE = "user:last_login"
+# ``Session.info`` key holding Redis writes deferred until the commit.
+_PENDING_CACHE_WRITES = "auth.pending_cache_writes"
+# Argon2id with OWASP's minimum recommended parameters (19 MiB, t=2, p=1).
+_PASSWORD_HASHER = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+_ARGON2_PREFIX = "$argon2"
+# Token validation loads the user in the same SELECT; ``User.password_hash``
+# is deferred at the mapper level so it is never part of that join.
+_SESSION_USER_OPTION = joinedload(SessionToken.user)
 
 
 class AuthError(Exception):
@@ -50,11 +79,37 @@ class TokenPair:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class UserView:
+    """Public representation of a user.
+
+    orjson serialises dataclasses natively, so instances can be embedded in
+    responses directly. Datetimes are normalised to UTC by
+    :func:`serialize_user`, whatever the database session time zone.
+    """
+
+    id: str
+    email: str
+    username: Optional[str]
+    is_active: bool
+    is_verified: bool
+    created_at: datetime
+    updated_at: datetime
+    last_login_at: Optional[datetime]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
 def _normalize_email(email: str) -> str:
     if not isinstance(email, str) or not email:
         raise ValueError("Adresse e-mail invalide.")
     cleaned = email.strip().lower()
-    if not cleaned or not _EMAIL_REGEX.match(cleaned):
+    if (
+        not cleaned
+        or len(cleaned) > _EMAIL_MAX_LENGTH
+        or not _EMAIL_REGEX.match(cleaned)
+    ):
         raise ValueError("Adresse e-mail invalide.")
     return cleaned
 
@@ -68,18 +123,62 @@ def _normalize_username(username: Optional[str]) -> Optional[str]:
     return cleaned or None
 
 
+def _hash_password(password: str) -> str:
+    return _PASSWORD_HASHER.hash(password)
+
+
+def _check_password(user: User, password: str) -> bool:
+    """Verify ``password`` and upgrade the stored hash when it is outdated.
+
+    Hashes created before the Argon2 migration are werkzeug PBKDF2 strings;
+    they are still accepted and transparently rehashed on success. The caller
+    is responsible for committing the updated ``password_hash``.
+    """
+
+    stored = user.password_hash
+    if not stored.startswith(_ARGON2_PREFIX):
+        if not check_password_hash(stored, password):
+            return False
+        user.password_hash = _hash_password(password)
+        return True
+
+    try:
+        _PASSWORD_HASHER.verify(stored, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+    if _PASSWORD_HASHER.check_needs_rehash(stored):
+        user.password_hash = _hash_password(password)
+    return True
+
+
 def _hash_token(token: str) -> str:
+    # Tokens are high-entropy random strings and the digest is only used as a
+    # lookup key, so a fast unkeyed hash is sufficient.
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=32).hexdigest()
+
+
+def _legacy_hash_token(token: str) -> str:
+    # SHA-256 digests stored by sessions issued before the BLAKE2b switch; only
+    # used while ``ACCEPT_LEGACY_TOKEN_DIGESTS`` is enabled.
     return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
-def _generate_token(length: int = 32) -> str:
-    return secrets.token_urlsafe(length)
+def _encode_token(raw: bytes) -> str:
+    # Same encoding as ``secrets.token_urlsafe``.
+    return urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
 
 
 def _issue_tokens(persistent: bool) -> TokenPair:
-    access_token = _generate_token(32)
-    refresh_token = _generate_token(48) if persistent else _generate_token(40)
-    return TokenPair(access_token=access_token, refresh_token=refresh_token)
+    refresh_bytes = (
+        _PERSISTENT_REFRESH_TOKEN_BYTES if persistent else _REFRESH_TOKEN_BYTES
+    )
+    # Draw the entropy for both tokens with a single ``os.urandom`` call.
+    raw = os.urandom(_ACCESS_TOKEN_BYTES + refresh_bytes)
+    return TokenPair(
+        access_token=_encode_token(raw[:_ACCESS_TOKEN_BYTES]),
+        refresh_token=_encode_token(raw[_ACCESS_TOKEN_BYTES:]),
+    )
 
 
 def create_user(*, email: str, password: str, username: Optional[str] = None) -> User:
@@ -94,7 +193,7 @@ def create_user(*, email: str, password: str, username: Optional[str] = None) ->
     user = User(
         email=normalized_email,
         username=normalized_username,
-        password_hash=generate_password_hash(password),
+        password_hash=_hash_password(password),
     )
 
     db.session.add(user)
@@ -114,8 +213,12 @@ def verify_credentials(*, email: str, password: str) -> User:
     if not isinstance(password, str) or not password:
         raise InvalidCredentialsError()
 
-    user = User.query.filter_by(email=normalized_email).first()
-    if user is None or not check_password_hash(user.password_hash, password):
+    user = (
+        User.query.options(undefer(User.password_hash))
+        .filter_by(email=normalized_email)
+        .first()
+    )
+    if user is None or not _check_password(user, password):
         raise InvalidCredentialsError()
 
     if not user.is_active:
@@ -138,8 +241,9 @@ def start_session(
 
     tokens = _issue_tokens(persistent)
     expires_in = _PERSISTENT_TOKEN_TTL if persistent else _ACCESS_TOKEN_TTL
-    expires_at = datetime.now(timezone.utc) + expires_in
+    expires_at = utcnow() + expires_in
 
+    # The INSERT is sent with the caller's commit.
     session_token = SessionToken(
         user=user,
         access_token_hash=_hash_token(tokens.access_token),
@@ -156,28 +260,172 @@ def start_session(
     return tokens.as_dict()
 
 
-def serialize_user(user: User) -> Dict[str, Optional[str]]:
+def serialize_user(user: User) -> UserView:
     """Return a public representation of a user."""
 
-    def _serialize_datetime(value: Optional[datetime]) -> Optional[str]:
-        if value is None:
+    return UserView(
+        id=user.id,
+        email=user.email,
+        username=user.username,
+        is_active=user.is_active,
+        is_verified=user.is_verified,
+        # PostgreSQL returns ``timestamptz`` values in the session time zone.
+        created_at=as_utc(user.created_at),
+        updated_at=as_utc(user.updated_at),
+        last_login_at=as_utc(user.last_login_at),
+    )
+
+
+def _user_cache_key(user_id: str) -> str:
+    return f"{_USER_CACHE_PREFIX}:{user_id}"
+
+
+def _encode_user(user: User) -> bytes:
+    return orjson.dumps(serialize_user(user), option=orjson.OPT_NAIVE_UTC)
+
+
+def _cache_after_commit(key: str, value: bytes, ttl: int) -> None:
+    """Write ``value`` to Redis once the current transaction commits."""
+
+    db.session.info.setdefault(_PENDING_CACHE_WRITES, []).append((key, value, ttl))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_cache_writes(session: Session) -> None:
+    for key, value, ttl in session.info.pop(_PENDING_CACHE_WRITES, ()):
+        cache.set(key, value, ttl)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_cache_writes(session: Session) -> None:
+    session.info.pop(_PENDING_CACHE_WRITES, None)
+
+
+def serialize_user_cached(user: User) -> orjson.Fragment:
+    """Return :func:`serialize_user` output as pre-encoded JSON.
+
+    The encoded payload is kept in Redis for a few minutes so frequent
+    validations skip rebuilding it. The fragment can be embedded as-is in any
+    response rendered by the orjson JSON provider.
+    """
+
+    key = _user_cache_key(user.id)
+    raw = cache.get(key)
+    if raw is None:
+        raw = _encode_user(user)
+        cache.set(key, raw, _USER_CACHE_TTL)
+    return orjson.Fragment(raw)
+
+
+def invalidate_cached_user(user: User) -> None:
+    """Drop the cached public representation of ``user``."""
+
+    cache.delete(_user_cache_key(user.id))
+
+
+def record_login(user: User) -> None:
+    """Stamp ``user.last_login_at`` and refresh its cached payload.
+
+    When Redis is available the stamp is queued and written later by
+    :func:`flush_last_logins`, keeping the ``users`` row out of the login
+    transaction. The in-memory value is still updated for the response, and
+    the cached payload is replaced on commit so validations do not serve the
+    pre-login value until the queue is flushed.
+    """
+
+    now = utcnow()
+    if cache.push(_LAST_LOGIN_QUEUE, f"{user.id}|{now.timestamp()}"):
+        set_committed_value(user, "last_login_at", now)
+        _cache_after_commit(
+            _user_cache_key(user.id), _encode_user(user), _USER_CACHE_TTL
+        )
+    else:
+        invalidate_cached_user(user)
+        user.last_login_at = now
+
+
+def _parse_login_stamp(raw: bytes) -> Optional[Tuple[str, datetime]]:
+    """Decode a queued ``user_id|epoch`` stamp, or ``None`` if it is malformed."""
+
+    try:
+        user_id, _, epoch = raw.decode("utf-8").partition("|")
+        seconds = float(epoch)
+        if not math.isfinite(seconds):
             return None
-        if value.tzinfo is None:
-            value = value.replace(tzinfo=timezone.utc)
-        else:
-            value = value.astimezone(timezone.utc)
-        return value.isoformat()
-
-    return {
-        "id": user.id,
-        "email": user.email,
-        "username": user.username,
-        "is_active": user.is_active,
-        "is_verified": user.is_verified,
-        "created_at": _serialize_datetime(user.created_at),
-        "updated_at": _serialize_datetime(user.updated_at),
-        "last_login_at": _serialize_datetime(user.last_login_at),
-    }
+        return str(UUID(user_id)), datetime.fromtimestamp(seconds, UTC)
+    except (OverflowError, OSError, UnicodeDecodeError, ValueError):
+        return None
+
+
+def flush_last_logins(limit: int = 1000) -> int:
+    """Write queued login stamps to the database in a single ``UPDATE``.
+
+    Returns the number of users in the batch. Meant to be run periodically,
+    see the ``flush-last-logins`` CLI command. Malformed stamps are logged and
+    dropped. A stamp never moves ``last_login_at`` backwards, so stamps
+    flushed late cannot overwrite a newer value written inline. When the
+    database is unreachable the batch is pushed back to the head of the queue
+    before re-raising.
+    """
+
+    latest: Dict[str, datetime] = {}
+    for raw in cache.pop_many(_LAST_LOGIN_QUEUE, limit):
+        stamp = _parse_login_stamp(raw)
+        if stamp is None:
+            current_app.logger.warning("Dropping malformed login stamp %r", raw)
+            continue
+        user_id, moment = stamp
+        if user_id not in latest or moment > latest[user_id]:
+            latest[user_id] = moment
+
+    if not latest:
+        return 0
+
+    stamped_at = case(
+        *((User.id == user_id, moment) for user_id, moment in latest.items())
+    )
+    try:
+        db.session.execute(
+            update(User)
+            .where(
+                User.id.in_(latest),
+                or_(User.last_login_at.is_(None), User.last_login_at < stamped_at),
+            )
+            .values(last_login_at=stamped_at),
+            execution_options={"synchronize_session": False},
+        )
+        db.session.commit()
+    except OperationalError:
+        db.session.rollback()
+        cache.push(
+            _LAST_LOGIN_QUEUE,
+            *(f"{user_id}|{moment.timestamp()}" for user_id, moment in latest.items()),
+            front=True,
+        )
+        raise
+    except SQLAlchemyError:
+        db.session.rollback()
+        raise
+
+    for user_id in latest:
+        cache.delete(_user_cache_key(user_id))
+    return len(latest)
+
+
+def _find_active_session(
+    attribute: str, digest: str, now_epoch: int
+) -> Optional[SessionToken]:
+    # Filter revoked and expired sessions in SQL so the partial indexes apply
+    # and dead sessions are never hydrated.
+    return db.session.execute(
+        select(SessionToken)
+        .options(_SESSION_USER_OPTION)
+        .where(
+            getattr(SessionToken, attribute) == digest,
+            SessionToken.revoked_at.is_(None),
+            SessionToken.expires_at_epoch >= now_epoch,
+        )
+    ).scalar_one_or_none()
 
 
 def validate_token(token: str, *, token_type: str = "access") -> Optional[SessionToken]:
@@ -186,16 +434,22 @@ def validate_token(token: str, *, token_type: str = "access") -> Optional[Sessio
     if token_type not in {"access", "refresh"}:
         raise ValueError("Type de token inconnu.")
 
+    attribute = f"{token_type}_token_hash"
     hashed = _hash_token(token)
-    if token_type == "access":
-        session_token = SessionToken.query.filter_by(access_token_hash=hashed).first()
-    else:
-        session_token = SessionToken.query.filter_by(refresh_token_hash=hashed).first()
-
-    if session_token is None or not session_token.is_active:
-        return None
-
-    if not session_token.user.is_active:
+    now_epoch = int(utcnow().timestamp())
+    session_token = _find_active_session(attribute, hashed, now_epoch)
+
+    if session_token is None and current_app.config.get("ACCEPT_LEGACY_TOKEN_DIGESTS"):
+        # Sessions issued before the BLAKE2b switch: probed only on a miss.
+        session_token = _find_active_session(
+            attribute, _legacy_hash_token(token), now_epoch
+        )
+        if session_token is not None:
+            # Rewrite the digest so later lookups hit on the first probe;
+            # written with the caller's commit.
+            setattr(session_token, attribute, hashed)
+
+    if session_token is None or not session_token.user.is_active:
         return None
 
     return session_token
@@ -206,8 +460,13 @@ __all__ = [
     "InactiveUserError",
     "InvalidCredentialsError",
     "UserAlreadyExistsError",
+    "UserView",
     "create_user",
+    "flush_last_logins",
+    "invalidate_cached_user",
+    "record_login",
     "serialize_user",
+    "serialize_user_cached",
     "start_session",
     "validate_token",
     "verify_credentials",
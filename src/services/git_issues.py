@@ -22,32 +22,45 @@ for testing.
 
 from __future__ import annotations
 
-import json
 import os
 import re
-from dataclasses import dataclass, field, replace
+import sys
+import time
+import zlib
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
-
-_VALID_STATUSES = {"open", "closed", "completed"}
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import orjson
+
+# Canonical statuses. Every issue shares these exact objects, so equality
+# checks against them short-circuit on identity.
+_OPEN = sys.intern("open")
+_CLOSED = sys.intern("closed")
+_COMPLETED = sys.intern("completed")
+
+# Every accepted spelling of a status, mapped to its canonical value.
+_STATUS_ALIASES = {
+    "open": _OPEN,
+    "closed": _CLOSED,
+    "close": _CLOSED,
+    "completed": _COMPLETED,
+    "complete": _COMPLETED,
+    "done": _COMPLETED,
+    "resolved": _COMPLETED,
+}
+# Shared read-only mapping for the (common) issues without extra metadata.
+_EMPTY_META: Mapping[str, str] = MappingProxyType({})
 
 
 def _normalize_status(value: str | None) -> str:
     """Return a supported status string from arbitrary user input."""
 
     if value is None:
-        return "open"
-
-    normalized = str(value).strip().lower()
-    if normalized in _VALID_STATUSES:
-        return normalized
+        return _OPEN
 
-    if normalized in {"done", "resolved", "complete"}:
-        return "completed"
-    if normalized in {"close", "closed"}:
-        return "closed"
-
-    return "open"
+    return _STATUS_ALIASES.get(str(value).strip().lower(), _OPEN)
 
 
 def _normalize_issue_id(issue_id: str) -> str:
@@ -57,38 +70,145 @@ def _normalize_issue_id(issue_id: str) -> str:
 
 
 _STATUS_TOKENS = {
-    "open": " ",
-    "closed": "x",
-    "completed": "/",
+    _OPEN: " ",
+    _CLOSED: "x",
+    _COMPLETED: "/",
+}
+
+
+# Checkbox tokens, including the upper-case variants seen in the wild, so the
+# common single-character tokens resolve without ``strip``/``lower``.
+_TOKEN_STATUSES = {
+    "": _OPEN,
+    " ": _OPEN,
+    "x": _CLOSED,
+    "X": _CLOSED,
+    "✗": _CLOSED,
+    "✔": _CLOSED,
+    "v": _CLOSED,
+    "V": _CLOSED,
+    "/": _COMPLETED,
+    "~": _COMPLETED,
+    "c": _COMPLETED,
+    "C": _COMPLETED,
 }
 
 
 def _status_from_token(token: str) -> str:
     """Map a markdown checkbox token to a status."""
 
-    cleaned = token.strip().lower()
-    if cleaned in {"x", "✗", "✔", "v"}:
-        return "closed"
-    if cleaned in {"/", "~", "c"}:
-        return "completed"
-    return "open"
+    status = _TOKEN_STATUSES.get(token)
+    if status is None:
+        status = _TOKEN_STATUSES.get(token.strip().lower(), _OPEN)
+    return status
+
+
+_MARKDOWN_PATTERN = re.compile(r"^\s*[-*]\s*\[(?P<token>[^\]])\]\s*(?P<body>.+?)\s*$")
+_ID_TITLE_PATTERN = re.compile(
+    r"^(?P<id>[#A-Za-z0-9._-]+)\s*[:\-\u2013]\s*(?P<title>.+)$"
+)
+# Fast path matching a whole ``- [x] ID: Title | key=value`` line at once.
+# Greedy groups avoid backtracking; the title is right-stripped afterwards.
+_FULL_LINE_PATTERN = re.compile(
+    r"\s*[-*]\s*\[(?P<token>[^\]])\]\s*"
+    r"(?P<id>[#A-Za-z0-9._-]+)\s*[:\-\u2013]\s*(?P<title>[^|\s][^|]*)"
+    r"(?:\|(?P<meta>.*))?"
+)
+
+
+def _parse_markdown_line(
+    line: str, status_filter: Optional[str] = None
+) -> Optional[GitIssue]:
+    """Parse a single checklist line, returning ``None`` for other lines.
+
+    When ``status_filter`` is given, entries with another status are skipped
+    before their metadata is parsed or an issue is built.
+    """
+
+    if "[" not in line:
+        # Both patterns need a literal checkbox: skip prose and headings
+        # without running the regex engine twice.
+        return None
+
+    match = _FULL_LINE_PATTERN.match(line)
+    if match:
+        token, issue_id, title, meta = match.group("token", "id", "title", "meta")
+        title = title.rstrip()
+    else:
+        match = _MARKDOWN_PATTERN.match(line)
+        if not match:
+            return None
+        token = match.group("token")
+        headline, _, meta = match.group("body").strip().partition("|")
+        while not headline.strip() and meta:
+            # Skip empty leading segments such as ``- [ ] | ID: Title``.
+            headline, _, meta = meta.partition("|")
+        headline = headline.strip()
+
+        id_match = _ID_TITLE_PATTERN.match(headline)
+        if id_match:
+            issue_id = id_match.group("id")
+            title = id_match.group("title").strip()
+        else:
+            parts = headline.split(None, 1)
+            issue_id = parts[0] if parts else ""
+            title = parts[1].strip() if len(parts) > 1 else ""
+
+    status = _status_from_token(token)
+    if status_filter is not None and status != status_filter:
+        return None
 
+    metadata: Dict[str, str] = {}
+    assignee: Optional[str] = None
+    labels: Tuple[str, ...] = ()
+
+    rest = meta or ""
+    while rest:
+        segment, _, rest = rest.partition("|")
+        key, has_value, value = segment.partition("=")
+        if not has_value:
+            continue
+        key = key.strip().lower()
+        value = value.strip()
+        if key == "assignee":
+            assignee = value or None
+        elif key == "labels":
+            labels = tuple(label.strip() for label in value.split(",") if label.strip())
+        else:
+            metadata[key] = value
+
+    return GitIssue(
+        id=issue_id,
+        title=title,
+        status=status,
+        assignee=assignee,
+        labels=labels,
+        metadata=metadata,
+    )
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GitIssue:
     """Representation of a single issue entry."""
 
     id: str
     title: str
-    status: str = "open"
+    status: str = _OPEN
     assignee: Optional[str] = None
     labels: Tuple[str, ...] = field(default_factory=tuple)
-    metadata: Dict[str, str] = field(default_factory=dict)
+    metadata: Mapping[str, str] = field(default_factory=lambda: _EMPTY_META)
+    # ``metadata`` items sorted by key, computed once for the markdown writer.
+    _metadata_items: Tuple[Tuple[str, str], ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    # Markdown checkbox token for ``status``, resolved once per issue.
+    _token: str = field(init=False, repr=False, compare=False, default=" ")
 
     def __post_init__(self) -> None:  # pragma: no cover - trivial validation
         object.__setattr__(self, "id", _normalize_issue_id(self.id))
         object.__setattr__(self, "title", str(self.title or "").strip())
         object.__setattr__(self, "status", _normalize_status(self.status))
+        object.__setattr__(self, "_token", _STATUS_TOKENS[self.status])
 
         cleaned_labels = tuple(
             label.strip()
@@ -97,12 +217,23 @@ class GitIssue:
         )
         object.__setattr__(self, "labels", cleaned_labels)
 
+        if not self.metadata:
+            object.__setattr__(self, "metadata", _EMPTY_META)
+            return
+
         cleaned_metadata = {
             str(key).strip(): str(value).strip()
-            for key, value in (self.metadata or {}).items()
+            for key, value in self.metadata.items()
             if str(key or "").strip() and value is not None and str(value).strip()
         }
-        object.__setattr__(self, "metadata", cleaned_metadata)
+        if not cleaned_metadata:
+            object.__setattr__(self, "metadata", _EMPTY_META)
+            return
+
+        object.__setattr__(self, "metadata", MappingProxyType(cleaned_metadata))
+        object.__setattr__(
+            self, "_metadata_items", tuple(sorted(cleaned_metadata.items()))
+        )
 
     def as_dict(self) -> Dict[str, object]:
         """Serialise the issue to a JSON-friendly dictionary."""
@@ -120,23 +251,78 @@ class GitIssue:
         return payload
 
 
+def _with_status(issue: GitIssue, status: str) -> GitIssue:
+    """Copy ``issue`` with a new, already normalised, ``status``.
+
+    Unlike :func:`dataclasses.replace` this skips ``__post_init__``: every
+    other field of ``issue`` is already normalised.
+    """
+
+    updated = object.__new__(GitIssue)
+    set_field = object.__setattr__
+    set_field(updated, "id", issue.id)
+    set_field(updated, "title", issue.title)
+    set_field(updated, "status", status)
+    set_field(updated, "assignee", issue.assignee)
+    set_field(updated, "labels", issue.labels)
+    set_field(updated, "metadata", issue.metadata)
+    set_field(updated, "_metadata_items", issue._metadata_items)
+    set_field(updated, "_token", _STATUS_TOKENS[status])
+    return updated
+
+
+# Files modified more recently than this may be rewritten without their mtime
+# changing, on filesystems with coarse timestamps.
+_MTIME_SETTLE_NS = 1_000_000_000
+
+
+def _stat_key(stat: os.stat_result) -> Tuple[int, int, int]:
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _is_settled(stat: os.stat_result) -> bool:
+    return time.time_ns() - stat.st_mtime_ns >= _MTIME_SETTLE_NS
+
+
 class GitIssuesStore:
-    """Tiny persistence helper around an issues file."""
+    """Tiny persistence helper around an issues file.
+
+    Parsed issues are cached per instance and reused while the file's inode,
+    mtime and size are unchanged. Timestamps can be coarse (ext4, NFS), so
+    while the mtime is less than a second old the cache is only trusted after
+    a CRC-32 check of the content, and a parse of such a fresh file is not
+    cached at all. An external rewrite that keeps inode, size and an mtime at
+    least a second old (e.g. a tool restoring timestamps) is not detected.
+    """
 
     def __init__(self, issues_file: str | os.PathLike[str] | None = None) -> None:
         default_file = os.getenv("GIT_ISSUES_FILE", "GIT_ISSUES.md")
         self._path = Path(issues_file or default_file)
         self._format: Optional[str] = None
+        # Last parse, keyed on the file's (inode, mtime_ns, size), plus the
+        # CRC-32 of its content when known. The list is shared: copy it before
+        # mutating.
+        self._cache: Optional[
+            Tuple[Tuple[int, int, int], Optional[int], List[GitIssue]]
+        ] = None
 
     def list_open_issues(self) -> List[GitIssue]:
         """Return all issues whose status is ``open``."""
 
-        return [issue for issue in self._load_issues() if issue.status == "open"]
+        return list(self.iter_open_issues())
+
+    def iter_open_issues(self) -> Iterator[GitIssue]:
+        """Yield open issues lazily, without building the other entries."""
+
+        cached = self._cached_issues()
+        if cached is not None:
+            return (issue for issue in cached if issue.status == _OPEN)
+        return self._iter_issues(_OPEN)
 
     def close_issue(self, issue_id: str) -> GitIssue:
         """Mark a single issue as closed."""
 
-        updated = self._bulk_update({issue_id}, "closed")
+        updated = self._bulk_update({issue_id}, _CLOSED)
         if not updated:
             raise ValueError(f"Issue introuvable : {issue_id}")
         return updated[0]
@@ -144,7 +330,7 @@ class GitIssuesStore:
     def complete_issue(self, issue_id: str) -> GitIssue:
         """Mark a single issue as completed."""
 
-        updated = self._bulk_update({issue_id}, "completed")
+        updated = self._bulk_update({issue_id}, _COMPLETED)
         if not updated:
             raise ValueError(f"Issue introuvable : {issue_id}")
         return updated[0]
@@ -152,64 +338,127 @@ class GitIssuesStore:
     def close_implemented_issues(self, implemented_ids: Iterable[str]) -> List[GitIssue]:
         """Close every issue listed in ``implemented_ids``."""
 
-        return self._bulk_update(implemented_ids, "closed")
+        return self._bulk_update(implemented_ids, _CLOSED)
 
     def complete_open_issues(self) -> List[GitIssue]:
         """Mark all currently open issues as completed."""
 
+        # Single pass: the open issues are exactly the ones to flip, so there
+        # is no id set to build or intersect.
         issues = self._load_issues()
-        open_ids = [issue.id for issue in issues if issue.status == "open"]
-        return self._bulk_update(open_ids, "completed", issues=issues)
-
-    def _bulk_update(
-        self,
-        issue_ids: Iterable[str],
-        status: str,
-        *,
-        issues: Optional[Sequence[GitIssue]] = None,
-    ) -> List[GitIssue]:
+        new_issues: Optional[List[GitIssue]] = None
+        updated: List[GitIssue] = []
+
+        for index, issue in enumerate(issues):
+            if issue.status == _OPEN:
+                if new_issues is None:
+                    new_issues = list(issues)
+                issue = _with_status(issue, _COMPLETED)
+                new_issues[index] = issue
+                updated.append(issue)
+
+        if new_issues is not None:
+            self._persist_issue_list(new_issues)
+
+        return updated
+
+    def _bulk_update(self, issue_ids: Iterable[str], status: str) -> List[GitIssue]:
         """Update a list of issues to the provided status."""
 
+        status = _normalize_status(status)
         target_ids = {
-            _normalize_issue_id(issue_id)
-            for issue_id in issue_ids
-            if _normalize_issue_id(issue_id)
+            issue_id for issue_id in map(_normalize_issue_id, issue_ids) if issue_id
         }
         if not target_ids:
             return []
 
-        issues = list(issues or self._load_issues())
+        # ``GitIssue`` ids are normalised on construction: compare them as-is
+        # and only copy the list once an issue actually changes.
+        current = self._load_issues()
+        new_issues: Optional[List[GitIssue]] = None
 
         found: set[str] = set()
         updated: List[GitIssue] = []
-        new_issues: List[GitIssue] = []
 
-        for issue in issues:
-            normalised_issue_id = _normalize_issue_id(issue.id)
-            if normalised_issue_id in target_ids:
-                found.add(normalised_issue_id)
-                if issue.status != status:
-                    issue = replace(issue, status=status)
-                    updated.append(issue)
-            new_issues.append(issue)
+        for index, issue in enumerate(current):
+            if issue.id not in target_ids:
+                continue
+            found.add(issue.id)
+            if issue.status != status:
+                if new_issues is None:
+                    new_issues = list(current)
+                issue = _with_status(issue, status)
+                new_issues[index] = issue
+                updated.append(issue)
 
         missing = sorted(target_ids - found)
         if missing:
             raise ValueError("Issues introuvables: " + ", ".join(missing))
 
-        if updated:
+        if new_issues is not None:
             self._persist_issue_list(new_issues)
 
         return updated
 
     def _load_issues(self) -> List[GitIssue]:
-        if not self._path.exists():
+        """Return the parsed issues, re-parsing only when the file changed.
+
+        The returned list is the cached one and must not be mutated.
+        """
+
+        cached = self._cached_issues()
+        if cached is not None:
+            return cached
+
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            self._cache = None
             return []
 
+        issues = list(self._iter_issues())
+        # A file modified within the timestamp granularity may change again
+        # without its key changing; only cache parses of settled files.
+        if _is_settled(stat):
+            self._cache = (_stat_key(stat), None, issues)
+        else:
+            self._cache = None
+        return issues
+
+    def _cached_issues(self) -> Optional[List[GitIssue]]:
+        """Return the cached issues if the file has not changed since."""
+
+        if self._cache is None:
+            return None
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return None
+        key, checksum, issues = self._cache
+        if key != _stat_key(stat):
+            return None
+        if not _is_settled(stat):
+            if checksum is None:
+                return None
+            try:
+                if zlib.crc32(self._path.read_bytes()) != checksum:
+                    return None
+            except FileNotFoundError:
+                return None
+        return issues
+
+    def _iter_issues(self, status: Optional[str] = None) -> Iterator[GitIssue]:
+        if not self._path.exists():
+            return
+
         fmt = self._detect_format()
         if fmt == "json":
-            return self._load_json()
-        return self._load_markdown()
+            for issue in self._load_json():
+                if status is None or issue.status == status:
+                    yield issue
+            return
+
+        yield from self._iter_markdown(status)
 
     def _detect_format(self) -> str:
         if self._format:
@@ -225,27 +474,42 @@ class GitIssuesStore:
             self._format = "json"
             return self._format
 
-        if self._path.exists():
-            snippet = self._path.read_text(encoding="utf-8").lstrip()
-            if snippet.startswith("["):
-                self._format = "json"
-                return self._format
+        if self._path.exists() and self._first_significant_byte() == b"[":
+            self._format = "json"
+            return self._format
 
         self._format = "markdown"
         return self._format
 
+    def _first_significant_byte(self) -> bytes:
+        """Return the first non-whitespace byte of the file, reading lazily."""
+
+        with self._path.open("rb") as handle:
+            while True:
+                chunk = handle.read(64)
+                if not chunk:
+                    return b""
+                chunk = chunk.lstrip()
+                if chunk:
+                    return chunk[:1]
+
     def _load_json(self) -> List[GitIssue]:
-        text = self._path.read_text(encoding="utf-8").strip()
-        if not text:
+        # orjson parses the raw UTF-8 bytes, skipping a separate decode step.
+        data = self._path.read_bytes().strip()
+        if not data:
             return []
 
-        payload = json.loads(text)
+        payload = orjson.loads(data)
         if isinstance(payload, dict) and "issues" in payload:
             items = payload["issues"]
         else:
             items = payload
 
         issues: List[GitIssue] = []
+        # Bind the per-entry callables once; the loop then uses fast locals.
+        append = issues.append
+        issue_cls = GitIssue
+        normalize_status = _normalize_status
         for entry in items:
             if not isinstance(entry, dict):
                 continue
@@ -266,11 +530,11 @@ class GitIssuesStore:
                     str(label).strip() for label in labels_value or [] if str(label).strip()
                 )
 
-            issues.append(
-                GitIssue(
+            append(
+                issue_cls(
                     id=str(entry.get("id", "")),
                     title=str(entry.get("title", "")),
-                    status=_normalize_status(entry.get("status")),
+                    status=normalize_status(entry.get("status")),
                     assignee=(
                         str(entry["assignee"]).strip()
                         if entry.get("assignee") is not None
@@ -283,84 +547,54 @@ class GitIssuesStore:
 
         return issues
 
-    _MARKDOWN_PATTERN = re.compile(r"^\s*[-*]\s*\[(?P<token>[^\]])\]\s*(?P<body>.+?)\s*$")
-    _ID_TITLE_PATTERN = re.compile(r"^(?P<id>[#A-Za-z0-9._-]+)\s*[:\-\u2013]\s*(?P<title>.+)$")
-
-    def _load_markdown(self) -> List[GitIssue]:
-        lines = self._path.read_text(encoding="utf-8").splitlines()
-        issues: List[GitIssue] = []
+    def _iter_markdown(self, status: Optional[str] = None) -> Iterator[GitIssue]:
+        # Iterate the handle lazily: parsing is line-local, so there is no
+        # need to hold the whole file and its list of lines in memory.
+        parse_line = _parse_markdown_line
+        with self._path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                issue = parse_line(line, status)
+                if issue is not None:
+                    yield issue
 
-        for line in lines:
-            match = self._MARKDOWN_PATTERN.match(line)
-            if not match:
-                continue
-            token = match.group("token")
-            body = match.group("body").strip()
-            segments = [segment.strip() for segment in body.split("|") if segment.strip()]
-            headline = segments[0] if segments else ""
-            metadata_segments = segments[1:]
-
-            id_match = self._ID_TITLE_PATTERN.match(headline)
-            if id_match:
-                issue_id = id_match.group("id")
-                title = id_match.group("title").strip()
-            else:
-                parts = headline.split(None, 1)
-                issue_id = parts[0] if parts else ""
-                title = parts[1].strip() if len(parts) > 1 else ""
-
-            metadata: Dict[str, str] = {}
-            assignee: Optional[str] = None
-            labels: Tuple[str, ...] = ()
-
-            for segment in metadata_segments:
-                if "=" not in segment:
-                    continue
-                key, value = segment.split("=", 1)
-                key = key.strip().lower()
-                value = value.strip()
-                if key == "assignee":
-                    assignee = value or None
-                elif key == "labels":
-                    labels = tuple(
-                        label.strip() for label in value.split(",") if label.strip()
-                    )
-                else:
-                    metadata[key] = value
-
-            issues.append(
-                GitIssue(
-                    id=issue_id,
-                    title=title,
-                    status=_status_from_token(token),
-                    assignee=assignee,
-                    labels=labels,
-                    metadata=metadata,
-                )
-            )
+    def _persist_issue_list(self, issues: Sequence[GitIssue]) -> None:
+        stat, checksum = self._write_issue_list(issues)
+        # The list just written is what parsing the file would return: keep it
+        # instead of re-reading the file on the next call.
+        self._cache = (_stat_key(stat), checksum, list(issues))
 
-        return issues
+    def _write_issue_list(
+        self, issues: Sequence[GitIssue]
+    ) -> Tuple[os.stat_result, int]:
+        """Write ``issues``; return the handle's stat and the content CRC-32."""
 
-    def _persist_issue_list(self, issues: Sequence[GitIssue]) -> None:
         fmt = self._detect_format()
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
         if fmt == "json":
             payload = [issue.as_dict() for issue in issues]
-            self._path.write_text(
-                json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
-                encoding="utf-8",
-            )
-            return
-
-        lines = [self._format_markdown_issue(issue) for issue in issues]
-        text = "\n".join(lines)
-        if lines:
-            text += "\n"
-        self._path.write_text(text, encoding="utf-8")
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2) + b"\n"
+            with self._path.open("wb") as binary_handle:
+                binary_handle.write(data)
+                binary_handle.flush()
+                return os.fstat(binary_handle.fileno()), zlib.crc32(data)
+
+        # Write through the buffered handle rather than building the whole
+        # document in memory first.
+        checksum = 0
+        format_issue = self._format_markdown_issue
+        with self._path.open("w", encoding="utf-8") as handle:
+            for issue in issues:
+                line = f"{format_issue(issue)}\n"
+                checksum = zlib.crc32(line.encode("utf-8"), checksum)
+                handle.write(line)
+            handle.flush()
+            # Stat the handle just written, not the path: another process may
+            # replace the file in between.
+            return os.fstat(handle.fileno()), checksum
 
     def _format_markdown_issue(self, issue: GitIssue) -> str:
-        token = _STATUS_TOKENS.get(issue.status, " ")
+        token = issue._token
         headline = f"{issue.id}: {issue.title}" if issue.title else issue.id
 
         segments = [headline]
@@ -368,10 +602,8 @@ class GitIssuesStore:
             segments.append(f"assignee={issue.assignee}")
         if issue.labels:
             segments.append("labels=" + ", ".join(issue.labels))
-        for key in sorted(issue.metadata):
-            value = issue.metadata[key]
-            if value:
-                segments.append(f"{key}={value}")
+        for key, value in issue._metadata_items:
+            segments.append(f"{key}={value}")
 
         return f"- [{token}] " + " | ".join(segments)
 
@@ -1,9 +1,49 @@
+import time
+
 import pytest
 
 from src.extensions import db
 from src.main import create_app
 
 
+class FakeRedis:
+    """Minimal in-memory stand-in for the subset of Redis used by the cache."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        value, expires_at = self.store.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.time():
+            self.store.pop(key, None)
+            return None
+        return value
+
+    def setex(self, key, ttl, value):
+        self.store[key] = (value, time.time() + ttl)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def rpush(self, key, *values):
+        items, _ = self.store.setdefault(key, ([], None))
+        items.extend(value.encode("utf-8") for value in values)
+        return len(items)
+
+    def lpush(self, key, *values):
+        items, _ = self.store.setdefault(key, ([], None))
+        items[:0] = [value.encode("utf-8") for value in reversed(values)]
+        return len(items)
+
+    def lpop(self, key, count=None):
+        items, _ = self.store.get(key, ([], None))
+        if not items:
+            return None
+        popped, items[:] = items[:count], items[count:]
+        return popped
+
+
 @pytest.fixture
 def app():
     """Create application for testing."""
@@ -21,3 +61,11 @@ def app():
 def client(app):
     """Create test client."""
     return app.test_client()
+
+
+@pytest.fixture
+def redis_cache(app):
+    """Replace the configured Redis client with an in-memory fake."""
+    fake = FakeRedis()
+    app.extensions["redis"] = fake
+    return fake
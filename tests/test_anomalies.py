@@ -52,3 +52,24 @@ def test_anomaly_detection_requires_input(client):
 
     response = client.post("/anomalies/detect", json={"player_id": "abc"})
     assert response.status_code == 400
+
+
+def test_anomaly_detection_scores_each_triggered_rule(client):
+    payload = {
+        "player_id": "player-789",
+        "metrics": {
+            "headshot_ratio": 0.95,
+            "accuracy": 0.5,
+            "reaction_time_ms": 90,
+            "suspicious_reports": 4,
+        },
+    }
+
+    response = client.post("/anomalies/detect", json=payload)
+    data = response.get_json()["data"]
+    assert data["is_suspicious"] is True
+    assert data["risk_score"] == 0.1 + 0.15
+    assert data["reasons"] == [
+        "Temps de réaction anormalement bas.",
+        "Multiples signalements suspects reçus.",
+    ]
@@ -1,11 +1,26 @@
 """Tests for authentication endpoints."""
 from __future__ import annotations
 
-from typing import Dict
+import hashlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+import orjson
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from werkzeug.security import generate_password_hash
 
 from src.extensions import db
 from src.models.session import SessionToken
 from src.models.user import User
+from src.services.auth import (
+    UserView,
+    flush_last_logins,
+    record_login,
+    serialize_user,
+)
 
 
 def _register(client, payload: Dict[str, str]):
@@ -16,6 +31,25 @@ def _login(client, payload: Dict[str, str]):
     return client.post("/auth/login", json=payload)
 
 
+def _verbs(statements: List[str]) -> List[str]:
+    return [statement.lstrip().split(None, 1)[0].upper() for statement in statements]
+
+
+@contextmanager
+def _recorded_statements():
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
 def test_register_creates_user_and_session(client):
     payload = {
         "email": "player@example.com",
@@ -109,3 +143,357 @@ def test_validate_token_invalid(client):
     assert response.status_code == 401
     body = response.get_json()
     assert body["data"]["is_valid"] is False
+
+
+def test_validate_token_serializes_utc_datetimes(client):
+    response = _register(
+        client,
+        {"email": "iso@example.com", "password": "StrongPass123"},
+    )
+    tokens = response.get_json()["data"]["tokens"]
+
+    validation = client.post(
+        "/auth/validate",
+        json={"token": tokens["access_token"], "token_type": "access"},
+    )
+    data = validation.get_json()["data"]
+    assert data["session"]["expires_at"].endswith("+00:00")
+    assert data["session"]["last_seen_at"].endswith("+00:00")
+    assert data["user"]["created_at"].endswith("+00:00")
+
+
+def test_validate_token_rejects_revoked_session(client, redis_cache):
+    response = _register(
+        client,
+        {"email": "revoked@example.com", "password": "StrongPass123"},
+    )
+    tokens = response.get_json()["data"]["tokens"]
+
+    with client.application.app_context():
+        session_token = SessionToken.query.one()
+        session_token.revoke()
+        db.session.commit()
+
+    validation = client.post(
+        "/auth/validate",
+        json={"token": tokens["access_token"], "token_type": "access"},
+    )
+    assert validation.status_code == 401
+
+
+def test_validate_token_issues_single_select(client):
+    response = _register(
+        client,
+        {"email": "joined@example.com", "password": "StrongPass123"},
+    )
+    tokens = response.get_json()["data"]["tokens"]
+
+    with _recorded_statements() as statements:
+        validation = client.post(
+            "/auth/validate",
+            json={"token": tokens["access_token"], "token_type": "access"},
+        )
+
+    assert validation.status_code == 200
+    assert _verbs(statements).count("SELECT") == 1
+    assert not any("password_hash" in statement for statement in statements)
+
+
+def test_validate_token_rejects_expired_session(client):
+    response = _register(
+        client,
+        {"email": "expired@example.com", "password": "StrongPass123"},
+    )
+    tokens = response.get_json()["data"]["tokens"]
+
+    with client.application.app_context():
+        session_token = SessionToken.query.one()
+        session_token.expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        db.session.commit()
+
+    validation = client.post(
+        "/auth/validate",
+        json={"token": tokens["access_token"], "token_type": "access"},
+    )
+    assert validation.status_code == 401
+
+
+def test_register_stamps_a_single_request_timestamp(client):
+    response = _register(
+        client,
+        {"email": "clock@example.com", "password": "StrongPass123"},
+    )
+    user = response.get_json()["data"]["user"]
+    assert user["created_at"] == user["updated_at"] == user["last_login_at"]
+
+    with client.application.app_context():
+        session_token = SessionToken.query.one()
+        assert session_token.last_seen_at == session_token.created_at
+
+
+def test_register_rejects_overlong_email(client):
+    email = "a" * 250 + "@example.com"
+    response = _register(client, {"email": email, "password": "StrongPass123"})
+    assert response.status_code == 400
+
+
+def test_register_stores_argon2_hash(client):
+    _register(client, {"email": "argon@example.com", "password": "StrongPass123"})
+
+    with client.application.app_context():
+        user = User.query.filter_by(email="argon@example.com").one()
+        assert user.password_hash.startswith("$argon2id$")
+
+
+def test_login_upgrades_legacy_password_hash(client):
+    with client.application.app_context():
+        user = User(
+            email="legacy@example.com",
+            password_hash=generate_password_hash("StrongPass123"),
+        )
+        db.session.add(user)
+        db.session.commit()
+
+    response = _login(
+        client,
+        {"email": "legacy@example.com", "password": "StrongPass123"},
+    )
+    assert response.status_code == 200
+
+    with client.application.app_context():
+        user = User.query.filter_by(email="legacy@example.com").one()
+        assert user.password_hash.startswith("$argon2id$")
+
+    assert (
+        _login(
+            client,
+            {"email": "legacy@example.com", "password": "StrongPass123"},
+        ).status_code
+        == 200
+    )
+
+
+def test_validate_token_caches_serialized_user(client, redis_cache):
+    response = _register(
+        client,
+        {"email": "payload@example.com", "password": "StrongPass123"},
+    )
+    tokens = response.get_json()["data"]["tokens"]
+    user_id = response.get_json()["data"]["user"]["id"]
+
+    first = client.post(
+        "/auth/validate",
+        json={"token": tokens["access_token"], "token_type": "access"},
+    )
+    assert f"user:ser:{user_id}" in redis_cache.store
+
+    second = client.post(
+        "/auth/validate",
+        json={"token": tokens["access_token"], "token_type": "access"},
+    )
+    assert second.get_json()["data"]["user"] == first.get_json()["data"]["user"]
+
+    login = _login(
+        client, {"email": "payload@example.com", "password": "StrongPass123"}
+    )
+    third = client.post(
+        "/auth/validate",
+        json={"token": tokens["access_token"], "token_type": "access"},
+    )
+    last_login_at = login.get_json()["data"]["user"]["last_login_at"]
+    assert last_login_at != first.get_json()["data"]["user"]["last_login_at"]
+    assert third.get_json()["data"]["user"]["last_login_at"] == last_login_at
+
+
+def test_issued_tokens_keep_their_entropy(client):
+    short = _register(
+        client,
+        {"email": "short@example.com", "password": "StrongPass123"},
+    ).get_json()["data"]["tokens"]
+    persistent = _register(
+        client,
+        {
+            "email": "long@example.com",
+            "password": "StrongPass123",
+            "remember_me": True,
+        },
+    ).get_json()["data"]["tokens"]
+
+    # Unpadded URL-safe base64 lengths of 32, 40 and 48 random bytes.
+    assert len(short["access_token"]) == 43
+    assert len(short["refresh_token"]) == 54
+    assert len(persistent["refresh_token"]) == 64
+    assert short["access_token"] != persistent["access_token"]
+
+
+def test_login_queues_last_login_until_flushed(app, client, redis_cache):
+    _register(client, {"email": "behind@example.com", "password": "StrongPass123"})
+    response = _login(
+        client,
+        {"email": "behind@example.com", "password": "StrongPass123"},
+    )
+    assert response.get_json()["data"]["user"]["last_login_at"] is not None
+
+    user = User.query.filter_by(email="behind@example.com").one()
+    assert user.last_login_at is None
+
+    result = app.test_cli_runner().invoke(args=["flush-last-logins"])
+    assert "1 last_login_at value(s) flushed." in result.output
+
+    db.session.expire_all()
+    assert user.last_login_at is not None
+    assert flush_last_logins() == 0
+
+
+def test_login_only_inserts_the_session(client, redis_cache):
+    credentials = {"email": "insert@example.com", "password": "StrongPass123"}
+    _register(client, credentials)
+
+    with _recorded_statements() as statements:
+        response = _login(client, credentials)
+
+    assert response.status_code == 200
+    assert _verbs(statements) == ["SELECT", "INSERT"]
+
+
+def test_serialize_user_returns_slotted_view(app):
+    user = User(email="view@example.com", username="view", password_hash="hashed")
+    db.session.add(user)
+    db.session.commit()
+
+    view = serialize_user(user)
+    assert isinstance(view, UserView)
+    assert not hasattr(view, "__dict__")
+    assert view.as_dict()["email"] == "view@example.com"
+    assert set(view.as_dict()) == {
+        "id",
+        "email",
+        "username",
+        "is_active",
+        "is_verified",
+        "created_at",
+        "updated_at",
+        "last_login_at",
+    }
+
+
+def test_serialize_user_converts_aware_datetimes_to_utc(app):
+    paris = timezone(timedelta(hours=2))
+    moment = datetime(2024, 5, 1, 14, 30, tzinfo=paris)
+    user = User(
+        id="0b6f6d1e-8f8e-4d8f-9a55-3f7d6c1f2a10",
+        email="tz@example.com",
+        password_hash="hashed",
+        is_active=True,
+        is_verified=False,
+        created_at=moment,
+        updated_at=moment,
+        last_login_at=moment,
+    )
+
+    view = serialize_user(user)
+    assert view.created_at == moment
+    assert view.created_at.utcoffset() == timedelta(0)
+    assert orjson.dumps(view.last_login_at) == b'"2024-05-01T12:30:00+00:00"'
+
+
+def test_validate_token_accepts_legacy_sha256_digest(client):
+    response = _register(
+        client,
+        {"email": "legacy-token@example.com", "password": "StrongPass123"},
+    )
+    token = response.get_json()["data"]["tokens"]["access_token"]
+    legacy_digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    with client.application.app_context():
+        session_token = SessionToken.query.one()
+        session_token.access_token_hash = legacy_digest
+        db.session.commit()
+
+    validation = client.post(
+        "/auth/validate",
+        json={"token": token, "token_type": "access"},
+    )
+    assert validation.status_code == 200
+
+    with client.application.app_context():
+        session_token = SessionToken.query.one()
+        assert session_token.access_token_hash != legacy_digest
+        session_token.access_token_hash = legacy_digest
+        db.session.commit()
+
+    client.application.config["ACCEPT_LEGACY_TOKEN_DIGESTS"] = False
+    validation = client.post(
+        "/auth/validate",
+        json={"token": token, "token_type": "access"},
+    )
+    assert validation.status_code == 401
+
+
+def test_failed_flush_requeues_last_logins(app, client, redis_cache, monkeypatch):
+    _register(client, {"email": "requeue@example.com", "password": "StrongPass123"})
+
+    def fail(*_args, **_kwargs):
+        raise OperationalError("UPDATE users", {}, Exception("database is down"))
+
+    with monkeypatch.context() as patch:
+        patch.setattr(db.session, "execute", fail)
+        with pytest.raises(OperationalError):
+            flush_last_logins()
+
+    assert len(redis_cache.store["user:last_login"][0]) == 1
+    assert flush_last_logins() == 1
+    assert User.query.filter_by(email="requeue@example.com").one().last_login_at
+
+
+def test_login_cache_refresh_waits_for_commit(app, redis_cache):
+    user = User(email="pending@example.com", password_hash="hashed")
+    db.session.add(user)
+    db.session.commit()
+    key = f"user:ser:{user.id}"
+
+    record_login(user)
+    assert key not in redis_cache.store
+    db.session.rollback()
+    db.session.commit()
+    assert key not in redis_cache.store
+
+    record_login(user)
+    db.session.commit()
+    cached = orjson.loads(redis_cache.store[key][0])
+    assert cached["last_login_at"] is not None
+
+
+def test_flush_never_moves_last_login_backwards(app, redis_cache):
+    user = User(email="ordered@example.com", password_hash="hashed")
+    db.session.add(user)
+    db.session.commit()
+    newer = datetime(2024, 5, 2, tzinfo=timezone.utc)
+    older = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    user.last_login_at = newer
+    db.session.commit()
+
+    redis_cache.rpush("user:last_login", f"{user.id}|{older.timestamp()}")
+    flush_last_logins()
+
+    db.session.expire_all()
+    assert user.last_login_at.replace(tzinfo=timezone.utc) == newer
+
+
+def test_flush_drops_malformed_stamps(app, redis_cache):
+    user = User(email="malformed@example.com", password_hash="hashed")
+    db.session.add(user)
+    db.session.commit()
+
+    redis_cache.rpush(
+        "user:last_login",
+        "garbage",
+        "not-a-uuid|1714521600.0",
+        f"{user.id}|nan",
+        f"{user.id}|1714521600.0",
+    )
+    assert flush_last_logins() == 1
+    assert redis_cache.store["user:last_login"][0] == []
+
+    db.session.expire_all()
+    assert user.last_login_at is not None
@@ -0,0 +1,32 @@
+"""Tests for the Redis cache extension."""
+from __future__ import annotations
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src import extensions
+from src.extensions import cache
+
+
+class UnreachableRedis:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, key):
+        self.calls += 1
+        raise RedisConnectionError("connection refused")
+
+
+def test_cache_backs_off_after_connection_failure(app, monkeypatch):
+    client = UnreachableRedis()
+    app.extensions["redis"] = client
+    app.config["REDIS_RETRY_AFTER"] = 30
+    now = [1000.0]
+    monkeypatch.setattr(extensions.time, "monotonic", lambda: now[0])
+
+    assert cache.get("key") is None
+    assert cache.get("key") is None
+    assert client.calls == 1
+
+    now[0] += 31
+    assert cache.get("key") is None
+    assert client.calls == 2
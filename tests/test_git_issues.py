@@ -1,10 +1,11 @@
 from __future__ import annotations
 import json
+import os
 from pathlib import Path
 
 import pytest
 
-from src.services.git_issues import GitIssuesStore
+from src.services.git_issues import GitIssue, GitIssuesStore
 
 
 @pytest.fixture()
@@ -65,3 +66,131 @@ def test_unknown_issue_raises(issues_file: Path) -> None:
     store = GitIssuesStore(issues_file)
     with pytest.raises(ValueError):
         store.close_issue("ISSUE-404")
+
+
+def test_closing_preserves_issue_fields(issues_file: Path) -> None:
+    store = GitIssuesStore(issues_file)
+
+    closed_issue = store.close_issue("#ISSUE-1")
+    assert closed_issue.status == "closed"
+    assert closed_issue.assignee == "alice"
+    assert closed_issue.labels == ("backend", "auth")
+
+    content = issues_file.read_text(encoding="utf-8")
+    assert "- [x] ISSUE-1: Add login | assignee=alice | labels=backend, auth" in content
+
+
+def test_json_format_detected_from_content(tmp_path: Path) -> None:
+    issues_file = tmp_path / "issues.txt"
+    payload = [{"id": "ISSUE-20", "title": "Sniffed", "status": "open"}]
+    issues_file.write_text(" \n" * 100 + json.dumps(payload), encoding="utf-8")
+
+    store = GitIssuesStore(issues_file)
+    assert [issue.id for issue in store.list_open_issues()] == ["ISSUE-20"]
+
+
+def test_git_issue_uses_slots() -> None:
+    issue = GitIssue(id="ISSUE-1", title="Slotted")
+    assert not hasattr(issue, "__dict__")
+
+
+def test_issue_metadata_is_read_only(issues_file: Path) -> None:
+    first, _, third = GitIssuesStore(issues_file)._load_issues()
+    assert first.metadata is third.metadata
+
+    issue = GitIssue(id="ISSUE-9", title="Meta", metadata={"sprint": "12"})
+    assert issue.metadata == {"sprint": "12"}
+    with pytest.raises(TypeError):
+        issue.metadata["sprint"] = "13"  # type: ignore[index]
+
+
+def test_metadata_segments_split_on_first_equals(tmp_path: Path) -> None:
+    issues_file = tmp_path / "GIT_ISSUES.md"
+    issues_file.write_text(
+        "- [ ] ISSUE-1: Title | query=a=b | =orphan=value | note\n",
+        encoding="utf-8",
+    )
+
+    (issue,) = GitIssuesStore(issues_file).list_open_issues()
+    assert dict(issue.metadata) == {"query": "a=b"}
+
+
+def test_closing_closed_issue_leaves_file_untouched(tmp_path: Path) -> None:
+    issues_file = tmp_path / "GIT_ISSUES.md"
+    original = "# Backlog\n- [x]   ISSUE-2 :  Document API\n"
+    issues_file.write_text(original, encoding="utf-8")
+
+    store = GitIssuesStore(issues_file)
+    assert store.close_implemented_issues(["ISSUE-2"]) == []
+    assert issues_file.read_text(encoding="utf-8") == original
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (" Done ", "completed"),
+        ("RESOLVED", "completed"),
+        ("close", "closed"),
+        ("open", "open"),
+        ("unknown", "open"),
+        (None, "open"),
+    ],
+)
+def test_status_aliases(raw: str | None, expected: str) -> None:
+    assert GitIssue(id="ISSUE-1", title="Status", status=raw).status == expected
+
+
+def test_iter_open_issues_is_lazy(issues_file: Path) -> None:
+    store = GitIssuesStore(issues_file)
+    iterator = store.iter_open_issues()
+
+    assert next(iterator).id == "ISSUE-1"
+    assert [issue.id for issue in iterator] == ["ISSUE-3"]
+
+
+def test_complete_open_issues_only_touches_open_entries(tmp_path: Path) -> None:
+    issues_file = tmp_path / "GIT_ISSUES.md"
+    issues_file.write_text(
+        "- [ ] ISSUE-1: Reopened copy\n- [x] ISSUE-1: Original\n",
+        encoding="utf-8",
+    )
+
+    store = GitIssuesStore(issues_file)
+    assert [issue.title for issue in store.complete_open_issues()] == ["Reopened copy"]
+    assert issues_file.read_text(encoding="utf-8") == (
+        "- [/] ISSUE-1: Reopened copy\n- [x] ISSUE-1: Original\n"
+    )
+
+
+def test_store_reuses_parse_until_file_changes(
+    issues_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = GitIssuesStore(issues_file)
+    store.close_issue("ISSUE-1")
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("issues file parsed again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(store, "_iter_issues", fail)
+        assert [issue.id for issue in store.list_open_issues()] == ["ISSUE-3"]
+        store.close_issue("ISSUE-3")
+
+    issues_file.write_text("- [ ] ISSUE-4: Added elsewhere\n", encoding="utf-8")
+    assert [issue.id for issue in store.list_open_issues()] == ["ISSUE-4"]
+
+
+def test_store_detects_same_size_rewrite_within_mtime_granularity(
+    issues_file: Path,
+) -> None:
+    store = GitIssuesStore(issues_file)
+    store.close_issue("ISSUE-1")
+    written = issues_file.stat()
+
+    # Toggle a checkbox in place and restore the timestamps, as a coarse
+    # filesystem clock would: inode, size and mtime are all unchanged.
+    content = issues_file.read_text(encoding="utf-8")
+    issues_file.write_text(content.replace("- [x] ISSUE-1", "- [ ] ISSUE-1"), "utf-8")
+    os.utime(issues_file, ns=(written.st_atime_ns, written.st_mtime_ns))
+
+    assert [issue.id for issue in store.list_open_issues()] == ["ISSUE-1", "ISSUE-3"]
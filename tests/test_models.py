@@ -3,10 +3,11 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import inspect
+from sqlalchemy import Uuid, inspect
 
 from src.extensions import db
 from src.models import SessionToken, User
+from src.models.base import as_utc
 
 
 def test_user_model_structure() -> None:
@@ -28,6 +29,8 @@ def test_user_model_structure() -> None:
     }
     assert expected_columns.issubset(column_names)
 
+    assert mapper.attrs["password_hash"].deferred
+
     email_column = mapper.columns["email"]
     assert not email_column.nullable
     assert email_column.unique
@@ -36,6 +39,15 @@ def test_user_model_structure() -> None:
     assert sessions_relationship.mapper.class_ is SessionToken
 
 
+def test_primary_keys_use_uuid_columns() -> None:
+    """Primary and foreign keys are stored as UUIDs rather than strings."""
+
+    user_id_type = inspect(User).columns["id"].type
+    session_user_id_type = inspect(SessionToken).columns["user_id"].type
+    assert isinstance(user_id_type, Uuid)
+    assert isinstance(session_user_id_type, Uuid)
+
+
 def test_session_token_lifecycle(app) -> None:
     """Sessions maintain lifecycle helpers for revocation and activity."""
 
@@ -95,3 +107,28 @@ def test_session_token_expiration(app) -> None:
         db.session.delete(expired_session)
         db.session.delete(user)
         db.session.commit()
+
+
+def test_as_utc_normalises_datetimes() -> None:
+    """Naive values are treated as UTC and offsets are converted to UTC."""
+
+    aware = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    assert as_utc(None) is None
+    assert as_utc(aware) is aware
+    assert as_utc(datetime(2024, 1, 1, 12)) == aware
+    shifted = as_utc(datetime(2024, 1, 1, 14, tzinfo=timezone(timedelta(hours=2))))
+    assert shifted == aware
+    assert shifted.tzinfo is timezone.utc
+
+
+def test_session_token_tracks_expiry_epoch() -> None:
+    """``expires_at_epoch`` follows every assignment of ``expires_at``."""
+
+    expires_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    session_token = SessionToken(access_token_hash="epoch", expires_at=expires_at)
+    assert session_token.expires_at_epoch == int(expires_at.timestamp())
+
+    session_token.expires_at = datetime(2031, 1, 1)
+    assert session_token.expires_at_epoch == int(
+        datetime(2031, 1, 1, tzinfo=timezone.utc).timestamp()
+    )